@@ -1,7 +1,35 @@
 import os
-import json
+import functools
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+
+from functions import is_placeholder, load_mappings
+
+# Assistants only needed by opt-in features
+_OPTIONAL_ASSISTANTS = ('bundle',)
+
+
+@functools.lru_cache(maxsize=None)
+def _env(key: str, default: Optional[str] = None) -> Optional[str]:
+    """Read an environment variable once per process."""
+    return os.environ.get(key, default)
+
+
+@functools.lru_cache(maxsize=4)
+def _validated_mappings(path: Path) -> Dict[str, str]:
+    """Load the mappings at ``path`` and reject empty or placeholder ids."""
+    mappings = load_mappings(path)
+    placeholders = [
+        key for key, value in mappings.items()
+        if key not in _OPTIONAL_ASSISTANTS and is_placeholder(value)
+    ]
+    if placeholders:
+        raise ValueError(
+            f"Please configure the following assistant IDs in function_mappings.json: "
+            f"{', '.join(placeholders)}"
+        )
+    return mappings
+
 
 class Config:
     """Configuration management for LogiDebrief research prototype."""
@@ -13,7 +41,7 @@ class Config:
     def load_config(self):
         """Load configuration from environment variables and files."""
         # API Configuration
-        self.openai_api_key = os.getenv('OPENAI_API_KEY')
+        self.openai_api_key = _env('OPENAI_API_KEY')
         if not self.openai_api_key:
             raise ValueError(
                 "OPENAI_API_KEY not found in environment variables. "
@@ -30,8 +58,8 @@ class Config:
         self.examples_dir = self.base_dir / 'examples'
         
         # Logging Configuration
-        self.log_level = os.getenv('LOG_LEVEL', 'INFO')
-        self.log_file = os.getenv('LOG_FILE', 'logidebrief.log')
+        self.log_level = _env('LOG_LEVEL', 'INFO')
+        self.log_file = _env('LOG_FILE', 'logidebrief.log')
         
     def _load_assistant_ids(self) -> Dict[str, str]:
         """Load and validate OpenAI Assistant IDs from configuration file."""
@@ -40,22 +68,7 @@ class Config:
                 f"function_mappings.json not found at {self.function_mappings_path}"
             )
         
-        with open(self.function_mappings_path, 'r') as f:
-            mappings = json.load(f)
-        
-        # Check for placeholder values
-        placeholders = []
-        for key, value in mappings.items():
-            if 'YOUR_ASSISTANT_ID' in value or not value:
-                placeholders.append(key)
-        
-        if placeholders:
-            raise ValueError(
-                f"Please configure the following assistant IDs in function_mappings.json: "
-                f"{', '.join(placeholders)}"
-            )
-        
-        return mappings
+        return _validated_mappings(self.function_mappings_path)
     
     def validate(self) -> bool:
         """Validate all required configuration is present."""
@@ -1,42 +1,97 @@
-from openai import OpenAI
+import asyncio
+import copy
+import hashlib
 import json
 import time
 import os
 import logging
+import threading
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+
+from ._mappings import _loads, is_placeholder, load_mappings
 
 logger = logging.getLogger(__name__)
 
+# Assistants every FunctionAgents instance needs an id for
+REQUIRED_ASSISTANTS = ("address", "name", "phone", "general", "flags", "condition", "check")
+
+# Pooled threads keep every earlier message; runs only read the newest one
+# so replies do not depend on what the thread was used for before
+_LAST_MESSAGE_ONLY = {"type": "last_messages", "last_messages": 1}
+
+# Most assistant replies memoized per FunctionAgents instance
+_CACHE_SIZE = 256
+
+# Most idle threads kept per assistant type; extra ones are deleted at once
+_POOL_SIZE = 8
+
 
+def _drain_pools(pools, lock) -> List[Any]:
+    """Empty the idle thread pools and return the threads they held."""
+    with lock:
+        threads = [t for pool in pools.values() for t in pool]
+        pools.clear()
+    return threads
+
+
+def _delete_threads(client, threads):
+    for thread in threads:
+        try:
+            client.beta.threads.delete(thread.id)
+        except Exception as e:
+            logger.warning(f"Failed to delete thread: {e}")
+
+
+def _purge_pools(client, pools, lock):
+    """Delete every pooled thread; the finalizer of each FunctionAgents."""
+    _delete_threads(client, _drain_pools(pools, lock))
+
+
+def __getattr__(name):
+    # The openai SDK is slow to import, so it is only loaded when needed
+    if name in ("OpenAI", "AsyncOpenAI"):
+        import openai
+        return getattr(openai, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Polling helpers from before runs were streamed. FunctionAgents no longer
+# uses them; they are kept for code that calls them directly.
 def submit_message(assistant_id, thread, user_message, client):
     """Submit a message to an OpenAI assistant thread."""
-    try:
-        client.beta.threads.messages.create(
-            thread_id=thread.id, role="user", content=user_message
-        )
-        return client.beta.threads.runs.create(
-            thread_id=thread.id,
-            assistant_id=assistant_id
-        )
-    except Exception as e:
-        logger.error(f"Error submitting message: {e}")
-        raise
+    client.beta.threads.messages.create(
+        thread_id=thread.id, role="user", content=user_message
+    )
+    return client.beta.threads.runs.create(
+        thread_id=thread.id,
+        assistant_id=assistant_id
+    )
+
 
+def wait_on_run(run, thread, client, max_wait_time=60, initial_delay=0.05, max_delay=1.0):
+    """Wait for an assistant run to complete with timeout.
 
-def wait_on_run(run, thread, client, max_wait_time=60):
-    """Wait for an assistant run to complete with timeout."""
-    start_time = time.time()
+    The run is polled with exponential backoff, starting at ``initial_delay``
+    seconds and capped at ``max_delay``.
+    """
+    deadline = time.monotonic() + max_wait_time
+    delay = initial_delay
     while run.status == "queued" or run.status == "in_progress":
-        if time.time() - start_time > max_wait_time:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
             logger.warning(f"Run timeout after {max_wait_time} seconds")
             raise TimeoutError(f"Assistant run timed out after {max_wait_time} seconds")
         
+        time.sleep(min(delay, remaining))
+        delay = min(max_delay, delay * 1.7)
         run = client.beta.threads.runs.retrieve(
             thread_id=thread.id,
             run_id=run.id,
         )
-        time.sleep(0.1)
     
     if run.status == "failed":
         logger.error(f"Run failed with error: {run.last_error}")
@@ -47,20 +102,93 @@ def wait_on_run(run, thread, client, max_wait_time=60):
 
 def get_response(thread, client):
     """Retrieve messages from an assistant thread."""
+    return client.beta.threads.messages.list(thread_id=thread.id, order="asc")
+
+
+def _check_run(run):
+    """Raise unless a streamed run reached the ``completed`` status."""
+    if run is not None and run.status == "failed":
+        logger.error(f"Run failed with error: {run.last_error}")
+        raise RuntimeError(f"Assistant run failed: {run.last_error}")
+    if run is None or run.status != "completed":
+        status = run.status if run is not None else None
+        raise RuntimeError(f"Assistant run ended with status {status}")
+
+
+def stream_message(assistant_id, thread, user_message, client, max_wait_time=60):
+    """Post a message and stream an assistant run on it until it finishes.
+
+    Returns the messages the assistant produced during the run, so no
+    polling or separate listing of the thread is needed. Only the new
+    message is given to the run as context. Raises ``RuntimeError`` unless
+    the run completed.
+
+    Raises ``TimeoutError`` once the run has streamed for ``max_wait_time``
+    seconds. The same value bounds each read, so a stream that goes silent
+    fails with ``openai.APITimeoutError`` instead.
+    """
+    client.beta.threads.messages.create(
+        thread_id=thread.id, role="user", content=user_message
+    )
+    deadline = time.monotonic() + max_wait_time
+    with client.beta.threads.runs.stream(
+        thread_id=thread.id,
+        assistant_id=assistant_id,
+        timeout=max_wait_time,
+        truncation_strategy=_LAST_MESSAGE_ONLY,
+    ) as stream:
+        # The read timeout alone never fires while events keep arriving
+        for _ in stream:
+            if time.monotonic() > deadline:
+                logger.warning(f"Run timeout after {max_wait_time} seconds")
+                raise TimeoutError(f"Assistant run timed out after {max_wait_time} seconds")
+        run = stream.current_run
+        messages = stream.get_final_messages()
+
+    _check_run(run)
+    return messages
+
+
+async def stream_message_async(assistant_id, thread, user_message, client, max_wait_time=60):
+    """Async counterpart of :func:`stream_message`.
+
+    The whole run is cancelled with ``TimeoutError`` after ``max_wait_time``
+    seconds.
+    """
+    await client.beta.threads.messages.create(
+        thread_id=thread.id, role="user", content=user_message
+    )
+
+    async def run_to_end():
+        async with client.beta.threads.runs.stream(
+            thread_id=thread.id,
+            assistant_id=assistant_id,
+            timeout=max_wait_time,
+            truncation_strategy=_LAST_MESSAGE_ONLY,
+        ) as stream:
+            await stream.until_done()
+            return stream.current_run, await stream.get_final_messages()
+
     try:
-        return client.beta.threads.messages.list(thread_id=thread.id, order="asc")
-    except Exception as e:
-        logger.error(f"Error getting response: {e}")
-        raise
+        run, messages = await asyncio.wait_for(run_to_end(), max_wait_time)
+    except asyncio.TimeoutError:
+        logger.warning(f"Run timeout after {max_wait_time} seconds")
+        raise TimeoutError(f"Assistant run timed out after {max_wait_time} seconds") from None
+
+    _check_run(run)
+    return messages
 
 
 class FunctionAgents(object):
-    def __init__(self, api_key: Optional[str] = None, function_mappings_path: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, function_mappings_path: Optional[str] = None,
+                 batch_checks: bool = False):
         """Initialize FunctionAgents with API key and mappings.
         
         Args:
             api_key: OpenAI API key (defaults to OPENAI_API_KEY env var)
             function_mappings_path: Path to function mappings JSON file
+            batch_checks: Send several checks to the check and general
+                assistants in one prompt; they must be set up to answer it
         """
         # Get API key from parameter or environment
         self.api_key = api_key or os.getenv('OPENAI_API_KEY')
@@ -70,14 +198,16 @@ class FunctionAgents(object):
                 "Set OPENAI_API_KEY environment variable or pass api_key parameter."
             )
         
-        # Initialize OpenAI client
+        # Initialize OpenAI client; the async one is created on first use
+        from openai import OpenAI
         self.openai_client = OpenAI(api_key=self.api_key)
+        self._async_client = None
+        self._async_users = 0
         
         # Load function mappings
         mappings_path = function_mappings_path or Path(__file__).parent.parent / "function_mappings.json"
         try:
-            with open(mappings_path, 'r') as f:
-                self.function_map = json.load(f)
+            self.function_map = load_mappings(mappings_path)
             logger.info(f"Loaded function mappings from {mappings_path}")
         except FileNotFoundError:
             logger.error(f"Function mappings file not found: {mappings_path}")
@@ -85,45 +215,325 @@ class FunctionAgents(object):
         except json.JSONDecodeError as e:
             logger.error(f"Invalid JSON in function mappings: {e}")
             raise
+
+        # Resolve assistant ids once, failing early if a required one is missing
+        missing = [k for k in REQUIRED_ASSISTANTS if is_placeholder(self.function_map.get(k))]
+        if missing:
+            raise ValueError(
+                f"Please configure the following assistant IDs in {mappings_path}: {', '.join(missing)}"
+            )
+        # Placeholder ids are left unbound, so calling an unconfigured
+        # assistant raises ValueError instead of reaching the API
+        for assistant_type, assistant_id in self.function_map.items():
+            if not is_placeholder(assistant_id):
+                setattr(self, f"_aid_{assistant_type}", assistant_id)
         
+        self.batch_checks = batch_checks
         self.conversation = None
+        self._conv_str = None
+
+        # Idle threads kept per assistant type so calls can reuse them. Each
+        # holds posted transcripts, so they are also deleted if the instance
+        # is garbage collected or the interpreter exits without close()
+        self._threads: Dict[str, List[Any]] = {}
+        self._threads_lock = threading.Lock()
+        self._purge = weakref.finalize(self, _purge_pools, self.openai_client, self._threads, self._threads_lock)
+
+        # Parsed replies keyed by (assistant type, message digest), least
+        # recently used first
+        self._cache: "OrderedDict[Tuple[str, bytes], Dict[str, Any]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+    @property
+    def async_client(self):
+        """Async OpenAI client, created the first time an async call needs it."""
+        if self._async_client is None:
+            from openai import AsyncOpenAI
+            self._async_client = AsyncOpenAI(api_key=self.api_key)
+        return self._async_client
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+
+    def close(self):
+        """Delete all threads kept for reuse and close the API client.
+
+        :meth:`validate_all` closes the async client on its own event loop.
+        Code that makes other async calls must close with :meth:`aclose`
+        (or ``async with``), because the async client's connections belong
+        to the loop they were opened on.
+        """
+        self._purge()
+        self.openai_client.close()
+        if self._async_client is not None:
+            logger.warning("Async client left open; close FunctionAgents with aclose() after async calls")
+
+    async def aclose(self):
+        """Async counterpart of :meth:`close` that also closes the async client."""
+        for thread in self._take_threads():
+            await self._delete_thread_async(thread)
+        self.openai_client.close()
+        await self._close_async_client()
+
+    async def _close_async_client(self):
+        if self._async_client is not None:
+            client, self._async_client = self._async_client, None
+            await client.close()
+
+    def clear_cache(self):
+        """Forget all memoized assistant replies."""
+        with self._cache_lock:
+            self._cache.clear()
 
     def load_conversation(self, conversation):
         self.conversation = conversation
+        # Serialize once; every validator embeds this text in its message
+        if conversation is None or isinstance(conversation, str):
+            self._conv_str = conversation
+        else:
+            self._conv_str = json.dumps(conversation, separators=(',', ':'))
 
     def validate_address(self):
         """Validate address information from the conversation."""
-        return self._call_assistant('address', self.conversation)
+        return self._call_assistant('address', self._conv_str)
 
     def validate_name(self):
         """Validate name information from the conversation."""
-        return self._call_assistant('name', self.conversation)
+        return self._call_assistant('name', self._conv_str)
 
     def validate_phone(self):
         """Validate phone number information from the conversation."""
-        return self._call_assistant('phone', self.conversation)
+        return self._call_assistant('phone', self._conv_str)
 
     def validate_general_check(self, general_check):
         """Validate a general check against the conversation."""
-        message = f"check: {general_check}, \n conversation: {self.conversation}"
-        return self._call_assistant('general', message)
+        return self._call_assistant('general', self._build_message('check', general_check))
 
     def validate_context(self):
         """Validate context flags from the conversation."""
-        return self._call_assistant('flags', self.conversation)
+        return self._call_assistant('flags', self._conv_str)
 
     def validate_precondition(self, precondition):
         """Validate preconditions against the conversation."""
-        message = f"assertion: {precondition}, \n conversation: {self.conversation}"
-        return self._call_assistant('condition', message)
+        return self._call_assistant('condition', self._build_message('assertion', precondition))
 
     def validate_check(self, check):
         """Validate a specific check against the conversation."""
-        message = f"check: {check}, \n conversation: {self.conversation}"
-        return self._call_assistant('check', message)
-    
+        return self._call_assistant('check', self._build_message('check', check))
+
+    def validate_check_batch(self, checks: Iterable[str]) -> List[Dict[str, Any]]:
+        """Validate several checks against the conversation.
+
+        With ``batch_checks`` set this is one assistant call, otherwise one
+        concurrent call per check. Returns one result per check, in order,
+        shaped like :meth:`validate_check`.
+        """
+        return self._validate_batch('check', checks, self.validate_check)
+
+    def validate_general_check_batch(self, general_checks: Iterable[str]) -> List[Dict[str, Any]]:
+        """Validate several general checks, batched like :meth:`validate_check_batch`.
+
+        Returns one result per check, in order, shaped like :meth:`validate_general_check`.
+        """
+        return self._validate_batch('general', general_checks, self.validate_general_check)
+
+    def _validate_batch(self, assistant_type: str, items: Iterable[str], validate_one) -> List[Dict[str, Any]]:
+        """Send ``items`` to an assistant as one structured prompt.
+
+        Without ``batch_checks``, or if the reply does not hold one result
+        object per item, ``validate_one`` is called for every item instead,
+        concurrently.
+        """
+        items = list(items)
+        if not self.batch_checks or len(items) <= 1:
+            return self._validate_each(items, validate_one)
+
+        listing = "\n".join(f"- {item}" for item in items)
+        message = (
+            f"checks:\n{listing}\n"
+            f"Evaluate each check separately and return a JSON object "
+            f"{{\"results\": [{{\"result\": bool, \"explanations\": str}}, ...]}} "
+            f"with one entry per check, in the order given, \n conversation: {self._conv_str}"
+        )
+        reply = self._call_assistant(assistant_type, message)
+        results = reply.get('results') if isinstance(reply, dict) else None
+        if (not isinstance(results, list) or len(results) != len(items)
+                or not all(isinstance(r, dict) and 'result' in r and 'explanations' in r for r in results)):
+            logger.warning(f"Batched {assistant_type} reply did not hold a result for each of the "
+                           f"{len(items)} checks; validating them one by one")
+            return self._validate_each(items, validate_one)
+        return results
+
+    @staticmethod
+    def _validate_each(items: List[str], validate_one) -> List[Dict[str, Any]]:
+        """Call ``validate_one`` for every item concurrently, keeping their order."""
+        if len(items) <= 1:
+            return [validate_one(item) for item in items]
+        with ThreadPoolExecutor(max_workers=len(items)) as pool:
+            return list(pool.map(validate_one, items))
+
+    def validate_bundle(self, fields: Iterable[str] = ("address", "name", "phone", "flags")) -> Dict[str, Any]:
+        """Validate several fields of the conversation in a single assistant call.
+
+        The ``bundle`` assistant answers for all ``fields`` at once, saving one
+        round-trip per field compared to the individual validators.
+
+        Args:
+            fields: Validators to run, named as in function_map
+
+        Returns:
+            Dictionary keyed by field name, each value shaped like the result
+            of the matching ``validate_*`` method
+        """
+        message = (
+            f"Validate the following fields and return a JSON object keyed by field name: "
+            f"{', '.join(fields)}\nconversation: {self._conv_str}"
+        )
+        return self._call_assistant('bundle', message)
+
+    async def validate_all(self, checks: Iterable[str] = (), preconditions: Iterable[Any] = (),
+                           general_checks: Iterable[str] = ()) -> List[Any]:
+        """Run the full validator suite concurrently.
+
+        All assistant calls are issued at once on the async client, so the
+        total latency is that of the slowest call rather than their sum.
+
+        Args:
+            checks: Checks to validate with the ``check`` assistant
+            preconditions: Preconditions to validate with the ``condition`` assistant
+            general_checks: Checks to validate with the ``general`` assistant
+
+        Returns:
+            Results in the order address, name, phone, context flags, then one
+            entry per check, precondition and general check. A failed call is
+            returned as its exception instead of a result.
+
+        The async client is closed again once no ``validate_all`` call is
+        running, so the usual ``asyncio.run(agents.validate_all(...))``
+        followed by :meth:`close` leaves no connections open.
+        """
+        tasks = [
+            self._call_assistant_async('address', self._conv_str),
+            self._call_assistant_async('name', self._conv_str),
+            self._call_assistant_async('phone', self._conv_str),
+            self._call_assistant_async('flags', self._conv_str),
+        ]
+        tasks.extend(self._call_assistant_async('check', self._build_message('check', c)) for c in checks)
+        tasks.extend(self._call_assistant_async('condition', self._build_message('assertion', p))
+                     for p in preconditions)
+        tasks.extend(self._call_assistant_async('general', self._build_message('check', g))
+                     for g in general_checks)
+        self._async_users += 1
+        try:
+            return await asyncio.gather(*tasks, return_exceptions=True)
+        finally:
+            self._async_users -= 1
+            if not self._async_users:
+                await self._close_async_client()
+
+    def _build_message(self, label: str, value: Any) -> str:
+        """Prefix the loaded conversation with a labelled check or assertion."""
+        return f"{label}: {value}, \n conversation: {self._conv_str}"
+
+    def _check_conversation(self, assistant_type: str):
+        """Ensure conversation-only validators have a conversation to work on."""
+        if not self.conversation and assistant_type not in ['general', 'condition', 'check']:
+            raise ValueError("No conversation loaded. Call load_conversation() first.")
+
+    @staticmethod
+    def _parse_response(messages) -> Dict[str, Any]:
+        """Return the JSON payload of the assistant's reply, the last of ``messages``."""
+        if not messages:
+            return {}
+        msg = messages[-1]
+        try:
+            return _loads(msg.content[0].text.value)
+        except (json.JSONDecodeError, IndexError, AttributeError) as e:
+            logger.error(f"Failed to parse assistant response: {e}")
+            logger.debug(f"Raw response: {msg.content}")
+            raise ValueError(f"Invalid response from assistant: {e}")
+
+    @staticmethod
+    def _cache_key(assistant_type: str, message: str) -> Tuple[str, bytes]:
+        return assistant_type, hashlib.blake2b(message.encode(), digest_size=16).digest()
+
+    def _prepare_call(self, assistant_type: str, message: str):
+        """Run the checks shared by the sync and async call paths.
+
+        Returns the cache key and a copy of the memoized reply, or ``None``
+        if the message has not been answered yet.
+        """
+        self._check_conversation(assistant_type)
+        key = self._cache_key(assistant_type, message)
+        with self._cache_lock:
+            cached = self._cache.get(key)
+            if cached is None:
+                return key, None
+            self._cache.move_to_end(key)
+        return key, copy.deepcopy(cached)
+
+    def _assistant_id(self, assistant_type: str) -> str:
+        assistant_id = getattr(self, f"_aid_{assistant_type}", None)
+        if not assistant_id:
+            raise ValueError(f"No assistant ID found for type: {assistant_type}")
+        return assistant_id
+
+    def _finish_call(self, key: Tuple[str, bytes], response) -> Dict[str, Any]:
+        """Parse a run's messages and memoize a private copy of the reply."""
+        js_output = self._parse_response(response)
+        if js_output:
+            with self._cache_lock:
+                self._cache[key] = copy.deepcopy(js_output)
+                self._cache.move_to_end(key)
+                if len(self._cache) > _CACHE_SIZE:
+                    self._cache.popitem(last=False)
+        return js_output
+
+    def _acquire_thread(self, assistant_type: str):
+        """Pop an idle thread for ``assistant_type``, or ``None`` if there is none."""
+        with self._threads_lock:
+            pool = self._threads.get(assistant_type)
+            return pool.pop() if pool else None
+
+    def _release_thread(self, assistant_type: str, thread):
+        """Return a thread to the idle pool of ``assistant_type``.
+
+        Returns False, keeping nothing, if that pool is already full.
+        """
+        with self._threads_lock:
+            pool = self._threads.setdefault(assistant_type, [])
+            if len(pool) >= _POOL_SIZE:
+                return False
+            pool.append(thread)
+            return True
+
+    def _take_threads(self) -> List[Any]:
+        return _drain_pools(self._threads, self._threads_lock)
+
+    def _delete_thread(self, thread):
+        _delete_threads(self.openai_client, [thread])
+
+    async def _delete_thread_async(self, thread):
+        try:
+            await self.async_client.beta.threads.delete(thread.id)
+        except Exception as e:
+            logger.warning(f"Failed to delete thread: {e}")
+
     def _call_assistant(self, assistant_type: str, message: str) -> Dict[str, Any]:
         """Generic method to call an OpenAI assistant with error handling.
+
+        Replies are memoized per instance, so sending the same message to the
+        same assistant again returns a copy of the earlier result without an
+        API call. Only the most recent ``_CACHE_SIZE`` replies are kept.
         
         Args:
             assistant_type: Type of assistant to call (key in function_map)
@@ -132,48 +542,60 @@ class FunctionAgents(object):
         Returns:
             Parsed JSON response from the assistant
         """
-        if not self.conversation and assistant_type not in ['general', 'condition', 'check']:
-            raise ValueError("No conversation loaded. Call load_conversation() first.")
-        
+        key, cached = self._prepare_call(assistant_type, message)
+        if cached is not None:
+            return cached
+        assistant_id = self._assistant_id(assistant_type)
+
         cur_thread = None
+        reusable = False
         try:
-            # Create thread
-            cur_thread = self.openai_client.beta.threads.create()
-            
-            # Get assistant
-            assistant_id = self.function_map.get(assistant_type)
-            if not assistant_id:
-                raise ValueError(f"No assistant ID found for type: {assistant_type}")
-            
-            assistant = self.openai_client.beta.assistants.retrieve(assistant_id=assistant_id)
-            
-            # Submit message and wait for response
-            run = submit_message(assistant.id, cur_thread, message, client=self.openai_client)
-            wait_on_run(run, cur_thread, client=self.openai_client)
+            # Reuse an idle thread or create a new one
+            cur_thread = self._acquire_thread(assistant_type) or self.openai_client.beta.threads.create()
             
-            # Get response
-            response = get_response(cur_thread, self.openai_client)
-            
-            # Parse response
-            js_output = {}
-            for msg in response:
-                if msg.role == "assistant":
-                    try:
-                        js_output = json.loads(msg.content[0].text.value)
-                    except (json.JSONDecodeError, IndexError, AttributeError) as e:
-                        logger.error(f"Failed to parse assistant response: {e}")
-                        logger.debug(f"Raw response: {msg.content}")
-                        raise ValueError(f"Invalid response from assistant: {e}")
-            
-            return js_output
+            # Submit message and stream the run's reply
+            response = stream_message(assistant_id, cur_thread, message, client=self.openai_client)
+            reusable = True
+            return self._finish_call(key, response)
             
         except Exception as e:
             logger.error(f"Error calling assistant {assistant_type}: {e}")
             raise
         finally:
-            # Clean up thread
-            if cur_thread:
-                try:
-                    self.openai_client.beta.threads.delete(cur_thread.id)
-                except Exception as e:
-                    logger.warning(f"Failed to delete thread: {e}")
+            # Only threads whose run completed go back to the pool; any other
+            # run may still be attached and would block the next message
+            if cur_thread and not (reusable and self._release_thread(assistant_type, cur_thread)):
+                self._delete_thread(cur_thread)
+
+    async def _call_assistant_async(self, assistant_type: str, message: str) -> Dict[str, Any]:
+        """Async counterpart of :meth:`_call_assistant` using the async client.
+
+        Args:
+            assistant_type: Type of assistant to call (key in function_map)
+            message: Message to send to the assistant
+
+        Returns:
+            Parsed JSON response from the assistant
+        """
+        key, cached = self._prepare_call(assistant_type, message)
+        if cached is not None:
+            return cached
+        assistant_id = self._assistant_id(assistant_type)
+
+        cur_thread = None
+        reusable = False
+        try:
+            # Reuse an idle thread or create a new one
+            cur_thread = self._acquire_thread(assistant_type) or await self.async_client.beta.threads.create()
+
+            # Submit message and stream the run's reply
+            response = await stream_message_async(assistant_id, cur_thread, message, client=self.async_client)
+            reusable = True
+            return self._finish_call(key, response)
+
+        except Exception as e:
+            logger.error(f"Error calling assistant {assistant_type}: {e}")
+            raise
+        finally:
+            if cur_thread and not (reusable and self._release_thread(assistant_type, cur_thread)):
+                await self._delete_thread_async(cur_thread)
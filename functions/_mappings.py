@@ -0,0 +1,33 @@
+import functools
+import os
+import types
+from pathlib import Path
+from typing import Mapping
+
+try:
+    from orjson import loads as _loads
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    from json import loads as _loads
+
+# Marker the shipped function_mappings.json uses for ids still to be filled in
+PLACEHOLDER = 'YOUR_ASSISTANT_ID'
+
+
+def is_placeholder(assistant_id) -> bool:
+    """Return True if ``assistant_id`` is empty or still the shipped placeholder."""
+    return not assistant_id or PLACEHOLDER in assistant_id
+
+
+def load_mappings(path) -> Mapping[str, str]:
+    """Load the assistant id mappings at ``path``.
+
+    Each file is parsed once per process and shared read-only between
+    callers; equivalent spellings of the same path share one cache entry.
+    """
+    return _load_resolved(os.fspath(Path(path).resolve()))
+
+
+@functools.lru_cache(maxsize=4)
+def _load_resolved(path: str) -> Mapping[str, str]:
+    with open(path, 'rb') as f:
+        return types.MappingProxyType(_loads(f.read()))
@@ -1,12 +1,16 @@
-from functions import FunctionAgents
 import os
+import functools
 import json
+import re
 import logging
 import argparse
 import sys
 from pathlib import Path
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Dict, Any, Optional
+from typing import TYPE_CHECKING, Dict, Any, Optional
+
+if TYPE_CHECKING:
+    from functions import FunctionAgents
 
 # Try to load environment variables from .env file
 try:
@@ -15,6 +19,19 @@ try:
 except ImportError:
     pass  # dotenv not installed, rely on system environment variables
 
+# JSON parsing shares the orjson/json fallback of the functions package
+from functions import _loads
+
+# Use orjson for serialisation when it is installed
+try:
+    import orjson
+
+    def _dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj, indent=4).encode()
+
 # Configure logging
 logging.basicConfig(
     level=os.getenv('LOG_LEVEL', 'INFO'),
@@ -26,19 +43,160 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Agent calls are network-bound, so the pools run well above the core count
+_MAX_WORKERS = (os.cpu_count() or 1) * 4
+
+# Checks sent to an agent per batched call
+_CHECK_BATCH_SIZE = 8
+
+_DELIM_RE = re.compile(r'[(),]')
+
+# Fields a task configuration must provide
+_REQUIRED = ('incident_spec',)
+_INCIDENT_REQUIRED = ('incident_type',)
+
+# Report entries that share the guidecard precondition explanation
+_PRECOND_EXPL_KEYS = (
+    "Call-taker used guidecards to obtain additional information?",
+    "Call-taker used guidecards to provide prearrival instructions?",
+)
+
 def relaxation(boolean_list, x):
     """
     Check if the number of False values in the list is fewer than x.
 
     Parameters:
         - boolean_list (list): A list of boolean values.
-        - x (int): Threshold for the number of False values.
+        - x (int): Threshold for the number of False values. A threshold of 0
+          or less allows no False values at all.
 
     Returns:
         - True if the number of False values is fewer than x, otherwise False.
     """
-    false_count = sum(1 for b in boolean_list if not b)  # Count the False values
-    return false_count < x
+    if x <= 0:
+        return all(boolean_list)
+    false_count = 0
+    for b in boolean_list:
+        if not b:
+            false_count += 1
+            if false_count >= x:  # Stop as soon as the threshold is reached
+                return False
+    return True
+
+
+def _chunks(items, size=_CHECK_BATCH_SIZE):
+    """Split a list into consecutive batches of at most ``size`` items."""
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+def _check_one(validate, item):
+    return [validate(item)]
+
+
+def _submit_checks(executor, functions, items, general=False):
+    """Submit checks to ``executor``, mapping each future to the items it answers.
+
+    Items are sent in chunks when ``functions.batch_checks`` is set, and one
+    call per item otherwise. Every future yields one result per item.
+    """
+    if functions.batch_checks:
+        validate = functions.validate_general_check_batch if general else functions.validate_check_batch
+        return {executor.submit(validate, chunk): chunk for chunk in _chunks(items)}
+    validate = functions.validate_general_check if general else functions.validate_check
+    return {executor.submit(_check_one, validate, item): [item] for item in items}
+
+
+current_dir = os.path.dirname(__file__)
+
+
+@functools.lru_cache(maxsize=64)
+def _guidecard(incident_type):
+    """Return the (conditions, questions, instructions) paths for an incident type."""
+    base = Path(current_dir) / "guidecards" / incident_type
+    return base / "conditions.json", base / "questions.json", base / "instructions.json"
+
+
+@functools.lru_cache(maxsize=64)
+def _protocol(flag):
+    """Return the (conditions, instructions) paths for a critical-flag protocol."""
+    base = Path(current_dir) / "protocols" / flag
+    return base / "conditions.json", base / "instructions.json"
+
+
+@functools.lru_cache(maxsize=128)
+def _load_json(path):
+    """Load a guidecard or protocol JSON file, parsing each path once per process."""
+    with open(path, 'rb') as file:
+        return _loads(file.read())
+
+
+def _split_expressions(s):
+    """Split a comma-separated argument list, accounting for nested parentheses."""
+    expressions = []
+    bracket_level = 0
+    last_index = 0
+    # Only visit the delimiters instead of walking every character
+    for match in _DELIM_RE.finditer(s):
+        char = match.group()
+        if char == '(':
+            bracket_level += 1
+        elif char == ')':
+            bracket_level -= 1
+        elif bracket_level == 0:
+            expressions.append(s[last_index:match.start()].strip())
+            last_index = match.end()
+    expressions.append(s[last_index:].strip())
+    return expressions
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_condition(condition_logic):
+    """
+    Compile a condition expression such as "AND(1, NOT(2))" into a predicate.
+
+    Each distinct expression is parsed once; the returned callable takes the set
+    of applied conditions and reports whether the expression holds.
+    """
+    expr = condition_logic.strip()
+    if expr.startswith("NOT(") and expr.endswith(")"):
+        operand = _compile_condition(expr[4:-1])
+        return lambda applied: not operand(applied)
+    elif expr.startswith("AND(") and expr.endswith(")"):
+        operands = tuple(_compile_condition(sub) for sub in _split_expressions(expr[4:-1]))
+        return lambda applied: all(op(applied) for op in operands)
+    elif expr.startswith("OR(") and expr.endswith(")"):
+        operands = tuple(_compile_condition(sub) for sub in _split_expressions(expr[3:-1]))
+        return lambda applied: any(op(applied) for op in operands)
+    else:
+        # Handle integer conditions
+        condition_id = int(expr)
+        return lambda applied: condition_id in applied
+
+
+def _index_items(data):
+    """
+    Resolve each item's 'i' or 'q' value and compile its condition 'c'.
+
+    Returns a tuple of (value, predicate) pairs, skipping items without a value;
+    the predicate is None for items that apply unconditionally.
+    """
+    items = []
+    for item in data:
+        value = item.get('i') or item.get('q')
+        if not value:
+            continue
+        condition = item.get('c')
+        if condition is None or condition.strip() == "":  # Apply unconditionally
+            items.append((value, None))
+        else:
+            items.append((value, _compile_condition(condition)))
+    return tuple(items)
+
+
+@functools.lru_cache(maxsize=128)
+def _load_items(path):
+    """Load a questions or instructions file as indexed (value, predicate) pairs."""
+    return _index_items(_load_json(path))
 
 
 def get_satisfied_values(applied_conditions, json_data):
@@ -47,78 +205,29 @@ def get_satisfied_values(applied_conditions, json_data):
     against the given list of applied conditions. If 'c' is null, the value always applies.
 
     Parameters:
-    - applied_conditions: A list or set of integers representing satisfied conditions.
+    - applied_conditions: A set or frozenset of integers representing satisfied conditions.
+      Other iterables are converted, but callers evaluating several files should
+      convert once and pass the same set to every call.
     - json_data: The JSON data as a list of dictionaries, or a path to a JSON file.
 
     Returns:
     - A list of satisfied 'i' or 'q' values.
     """
-    import json
-
-    # If json_data is a file path, load the data from the file
-    if isinstance(json_data, str):
-        with open(json_data, 'r') as file:
-            data = json.load(file)
+    # If json_data is a file path, use the items indexed when the file was loaded
+    if isinstance(json_data, (str, os.PathLike)):
+        items = _load_items(json_data)
     else:
-        data = json_data  # Assume json_data is already loaded as a list of dictionaries
+        items = _index_items(json_data)  # Assume json_data is already loaded as a list of dictionaries
 
     # Ensure applied_conditions is a set for efficient lookup
-    if not isinstance(applied_conditions, set):
-        applied_conditions = set(applied_conditions)
-
-    # Function to evaluate condition logic
-    def evaluate_condition(condition_logic, applied_conditions):
-        def eval_logic(expr):
-            expr = expr.strip()
-            if expr.startswith("NOT(") and expr.endswith(")"):
-                return not eval_logic(expr[4:-1])
-            elif expr.startswith("AND(") and expr.endswith(")"):
-                sub_exprs = split_expressions(expr[4:-1])
-                return all(eval_logic(sub) for sub in sub_exprs)
-            elif expr.startswith("OR(") and expr.endswith(")"):
-                sub_exprs = split_expressions(expr[3:-1])
-                return any(eval_logic(sub) for sub in sub_exprs)
-            else:
-                # Handle integer conditions
-                return int(expr) in applied_conditions
-
-        # Helper function to split expressions, accounting for nested parentheses
-        def split_expressions(s):
-            expressions = []
-            bracket_level = 0
-            last_index = 0
-            for index, char in enumerate(s):
-                if char == '(':
-                    bracket_level += 1
-                elif char == ')':
-                    bracket_level -= 1
-                elif char == ',' and bracket_level == 0:
-                    expressions.append(s[last_index:index].strip())
-                    last_index = index + 1
-            expressions.append(s[last_index:].strip())
-            return expressions
-
-        return eval_logic(condition_logic)
-
-    # Retrieve all 'i' or 'q' values where condition 'c' evaluates to True or 'c' is null
-    satisfied_values = []
-    for item in data:
-        condition = item.get('c')  # Retrieve the condition
-        if condition is None or condition.strip() == "":  # Apply unconditionally
-            value = item.get('i') or item.get('q')
-            if value:
-                satisfied_values.append(value)
-        else:
-            # Evaluate the condition logic
-            if evaluate_condition(condition, applied_conditions):
-                value = item.get('i') or item.get('q')
-                if value:
-                    satisfied_values.append(value)
+    if not isinstance(applied_conditions, (set, frozenset)):
+        applied_conditions = frozenset(applied_conditions)
 
-    return satisfied_values
+    # Retrieve all values whose condition evaluates to True or is null
+    return [value for value, predicate in items if predicate is None or predicate(applied_conditions)]
 
 
-def debrief_init(functions: FunctionAgents, conversation: str, task_json: Dict[str, Any]) -> Dict[str, Any]:
+def debrief_init(functions: "FunctionAgents", conversation: str, task_json: Dict[str, Any]) -> Dict[str, Any]:
     """Initial debrief function (legacy version).
     
     Args:
@@ -205,36 +314,9 @@ def debrief_init(functions: FunctionAgents, conversation: str, task_json: Dict[s
     }
 
 
-    address_check_return = functions.validate_address()
-    out_json["Call-taker obtained and verified the address"] = {
-        "asked address first": address_check_return["ask-first"],
-        "address double checking": address_check_return["address-confirmation"],
-        "obtained address": address_check_return["obtained-address"],
-        "double check at the end": address_check_return["double-checking-end"],
-        "result": address_check_return['overall-eval'],
-        "explanation": address_check_return['explanations']
-    }
-    logger.debug(f"Address validation result: {address_check_return}")
-
-    phone_check_return = functions.validate_phone()
-    out_json["Call-taker obtained and verified caller's phone"] = {
-        "asked phone number": phone_check_return["ask-phone-number"],
-        "phone number follow up": phone_check_return["phone-follow-up"],
-        "obtained phone number": phone_check_return["obtained-phone"],
-        "result": phone_check_return['overall-eval'],
-        "explanation": phone_check_return['explanations']
-    }
-    logger.debug(f"Phone validation result: {phone_check_return}")
-    #
-    name_check_return = functions.validate_name()
-    out_json["Call-taker obtained and verified caller's full name"] = {
-        "asked full name": name_check_return["ask-full-name"],
-        "full name follow up": name_check_return["name-follow-up"],
-        "obtained full name": name_check_return["obtained-name"],
-        "result": name_check_return['overall-eval'],
-        "explanation": name_check_return['explanations']
-    }
-    logger.debug(f"Name validation result: {name_check_return}")
+    crit = out_json["Call-taker used guide cards to provide Time / Life Critical Instructions?"]
+    addl = out_json["Call-taker used guidecards to obtain additional information?"]
+    prea = out_json["Call-taker used guidecards to provide prearrival instructions?"]
 
     general_checks = [
         "Call-taker asked what is the problem?",
@@ -244,136 +326,152 @@ def debrief_init(functions: FunctionAgents, conversation: str, task_json: Dict[s
         "Call-taker asked if the patient(s) breathing normally?",
         "Call-taker obtained scene safety / suspect information?"
     ]
-    for gc in general_checks:
-        if gc == "Call-taker obtained scene safety / suspect information":
-            temp_gc = "If the scene is potentially dangerous to first responders, call-taker obtained scene safety / suspect information"
-            out_json[gc] = {
-                "result": functions.validate_general_check(temp_gc)['result'],
-                "explanation": functions.validate_general_check(temp_gc)['explanations']
-            }
-        else:
-            out_json[gc] = {
-                "result": functions.validate_general_check(gc)['result'],
-                "explanation": functions.validate_general_check(gc)['explanations']
-            }
-
-    logger.debug(f"General checks completed")
-
-    flags_return = functions.validate_context()
-    critical_flags = flags_return['flags']
-    critical_explanations = flags_return['explanations']
-
-    out_json["Call-taker used guide cards to provide Time / Life Critical Instructions?"]["explanation"] = critical_explanations
-    if critical_flags and critical_flags[0] in ["AC", "AED", "BTA", "CB", "CPR", "OA"]:
-        file_path = os.path.join(f"./protocols/{critical_flags[0]}/", "conditions.json")
-        # print(file_path)
-        with open(file_path, "r") as file:
-            critical_conditions = json.load(file)
-    #
-        condition_return = functions.validate_precondition(critical_conditions)
-        applied_conditions = condition_return['result']
-        applied_condition_explanation = condition_return['explanations']
-        out_json["Call-taker used guidecards to obtain additional information?"]["explanation"] = applied_condition_explanation
-        out_json["Call-taker used guidecards to provide prearrival instructions?"]["explanation"] = applied_condition_explanation
-        # print(applied_conditions)
-
-        instructions_path = os.path.join(f"./protocols/{critical_flags[0]}/", "instructions.json")
-        with open(instructions_path, "r") as file:
-            all_instructions = json.load(file)
-
-        applied_instructions = get_satisfied_values(applied_conditions, all_instructions)
-        # print(applied_instructions)
-
-        session_instruction_check = []
-        for ai in applied_instructions:
-            session_instruction_check.append(functions.validate_check(ai)['result'])
-
-        # print(session_instruction_check)
-
-        if len(session_instruction_check) == 0:
-            out_json["Call-taker used guide cards to provide Time / Life Critical Instructions?"]["result"] = "N/A"
-        elif relaxation(session_instruction_check,int(0.0 * (len(applied_instructions)))):
-            out_json["Call-taker used guide cards to provide Time / Life Critical Instructions?"]["result"] = "YES"
-            out_json["Call-taker used guide cards to provide Time / Life Critical Instructions?"]["explanation"] += "Applied instructions are necessarily given."
-
-        elif False in session_instruction_check:
-            false_index = session_instruction_check.index(False)
-            out_json["Call-taker used guide cards to provide Time / Life Critical Instructions?"]["result"] = "NO"
-            out_json["Call-taker used guide cards to provide Time / Life Critical Instructions?"]["explanation"] += f"Applied instructions are not necessarily given, e.g., {applied_instructions[false_index]}."
-    else:
-        out_json["Call-taker used guide cards to provide Time / Life Critical Instructions?"]["result"] = "N/A"
-
-    logger.info("Critical instructions check: %s", 
-                out_json["Call-taker used guide cards to provide Time / Life Critical Instructions?"]["result"])
 
     incident_type = task_json["incident_spec"]["incident_type"]
-    questions_path = os.path.join(f"./guidecards/{incident_type}/", "questions.json")
-    prearrivals_path = os.path.join(f"./guidecards/{incident_type}/", "instructions.json")
-    conditions_path = os.path.join(f"./guidecards/{incident_type}/", "conditions.json")
+    conditions_path, questions_path, prearrivals_path = _guidecard(incident_type)
+
+    with ThreadPoolExecutor(max_workers=_MAX_WORKERS) as executor:
+        # Submit every agent call that does not depend on another result
+        address_future = executor.submit(functions.validate_address)
+        phone_future = executor.submit(functions.validate_phone)
+        name_future = executor.submit(functions.validate_name)
+        flags_future = executor.submit(functions.validate_context)
+
+        general_prompts = {}
+        for gc in general_checks:
+            if gc == "Call-taker obtained scene safety / suspect information":
+                general_prompts[gc] = "If the scene is potentially dangerous to first responders, call-taker obtained scene safety / suspect information"
+            else:
+                general_prompts[gc] = gc
+        prompt_checks = {prompt: gc for gc, prompt in general_prompts.items()}
+        general_checks_futures = _submit_checks(executor, functions, list(prompt_checks), general=True)
+
+        all_conditions = _load_json(conditions_path)
+        precond_future = executor.submit(functions.validate_precondition, all_conditions)
+
+        address_check_return = address_future.result()
+        out_json["Call-taker obtained and verified the address"] = {
+            "asked address first": address_check_return["ask-first"],
+            "address double checking": address_check_return["address-confirmation"],
+            "obtained address": address_check_return["obtained-address"],
+            "double check at the end": address_check_return["double-checking-end"],
+            "result": address_check_return['overall-eval'],
+            "explanation": address_check_return['explanations']
+        }
+        logger.debug(f"Address validation result: {address_check_return}")
+
+        phone_check_return = phone_future.result()
+        out_json["Call-taker obtained and verified caller's phone"] = {
+            "asked phone number": phone_check_return["ask-phone-number"],
+            "phone number follow up": phone_check_return["phone-follow-up"],
+            "obtained phone number": phone_check_return["obtained-phone"],
+            "result": phone_check_return['overall-eval'],
+            "explanation": phone_check_return['explanations']
+        }
+        logger.debug(f"Phone validation result: {phone_check_return}")
+
+        name_check_return = name_future.result()
+        out_json["Call-taker obtained and verified caller's full name"] = {
+            "asked full name": name_check_return["ask-full-name"],
+            "full name follow up": name_check_return["name-follow-up"],
+            "obtained full name": name_check_return["obtained-name"],
+            "result": name_check_return['overall-eval'],
+            "explanation": name_check_return['explanations']
+        }
+        logger.debug(f"Name validation result: {name_check_return}")
 
+        for future in as_completed(general_checks_futures):
+            for prompt, general_check_return in zip(general_checks_futures[future], future.result()):
+                out_json[prompt_checks[prompt]] = {
+                    "result": general_check_return['result'],
+                    "explanation": general_check_return['explanations']
+                }
+
+        logger.debug(f"General checks completed")
+
+        # The protocol to check depends on the detected flags
+        flags_return = flags_future.result()
+        critical_flags = flags_return['flags']
+        critical_explanations = flags_return['explanations']
+
+        crit["explanation"] = critical_explanations
+        if critical_flags and critical_flags[0] in ["AC", "AED", "BTA", "CB", "CPR", "OA"]:
+            file_path, instructions_path = _protocol(critical_flags[0])
+            critical_conditions = _load_json(file_path)
+
+            condition_return = functions.validate_precondition(critical_conditions)
+            applied_conditions = frozenset(condition_return['result'])
+
+            applied_instructions = get_satisfied_values(applied_conditions, instructions_path)
+
+            instruction_futures = _submit_checks(executor, functions, applied_instructions)
+            session_instruction_check = [r['result'] for future in instruction_futures for r in future.result()]
+
+            threshold = int(0.0 * len(applied_instructions))
+            if len(session_instruction_check) == 0:
+                crit["result"] = "N/A"
+            elif relaxation(session_instruction_check, threshold):
+                crit["result"] = "YES"
+                crit["explanation"] += "Applied instructions are necessarily given."
+
+            elif False in session_instruction_check:
+                false_index = session_instruction_check.index(False)
+                crit["result"] = "NO"
+                crit["explanation"] += f"Applied instructions are not necessarily given, e.g., {applied_instructions[false_index]}."
+        else:
+            crit["result"] = "N/A"
 
-    with open(conditions_path, "r") as file:
-        all_conditions = json.load(file)
+        logger.info("Critical instructions check: %s", crit["result"])
 
-    applied_conditions = functions.validate_precondition(all_conditions)['result']
-    # print(applied_conditions)
-    out_json["Call-taker used guidecards to obtain additional information?"]["explanation"] = functions.validate_precondition(all_conditions)['explanations']
-    out_json["Call-taker used guidecards to provide prearrival instructions?"]["explanation"] = functions.validate_precondition(all_conditions)['explanations']
-    with open(questions_path, "r") as file:
-        all_questions = json.load(file)
+        precond = precond_future.result()
+        applied_conditions = frozenset(precond['result'])
+        for key in _PRECOND_EXPL_KEYS:
+            out_json[key]["explanation"] = precond['explanations']
 
-    applied_questions = get_satisfied_values(applied_conditions, all_questions)
+        applied_questions = get_satisfied_values(applied_conditions, questions_path)
+        applied_prearrivals = get_satisfied_values(applied_conditions, prearrivals_path)
 
-    session_question_check = []
-    for aq in applied_questions:
-        session_question_check.append(functions.validate_check(aq))
+        # Items shared by questions and prearrivals are only checked once
+        unique_items = list(dict.fromkeys(applied_questions + applied_prearrivals))
+        check_futures = _submit_checks(executor, functions, unique_items)
+        check_results = {}
+        for future in as_completed(check_futures):
+            check_results.update(zip(check_futures[future], (r['result'] for r in future.result())))
+        session_question_check = [check_results[aq] for aq in applied_questions]
+        session_prearrivals_check = [check_results[ap] for ap in applied_prearrivals]
 
+    threshold = int(0.0 * len(applied_questions))
     if len(session_question_check) == 0:
-        out_json["Call-taker used guidecards to obtain additional information?"]["result"] = "N/A"
-    elif relaxation(session_question_check,int(0.0 * (len(applied_questions)))):
-        out_json["Call-taker used guidecards to obtain additional information?"]["result"] = "YES"
-        out_json["Call-taker used guidecards to obtain additional information?"]["explanation"] += "Applied instructions are necessarily given."
+        addl["result"] = "N/A"
+    elif relaxation(session_question_check, threshold):
+        addl["result"] = "YES"
+        addl["explanation"] += "Applied instructions are necessarily given."
 
     elif False in session_question_check:
         false_index = session_question_check.index(False)
-        out_json["Call-taker used guidecards to obtain additional information?"]["result"] = "NO"
-        out_json["Call-taker used guidecards to obtain additional information?"]["explanation"] += f"Applied instructions are not necessarily given, e.g., {applied_questions[false_index]}."
-
-    logger.info("Additional information check: %s",
-                out_json["Call-taker used guidecards to obtain additional information?"]["result"])
-
-    with open(prearrivals_path, "r") as file:
-        all_prearrivals = json.load(file)
+        addl["result"] = "NO"
+        addl["explanation"] += f"Applied instructions are not necessarily given, e.g., {applied_questions[false_index]}."
 
-    applied_prearrivals = get_satisfied_values(applied_conditions, all_prearrivals)
-    session_prearrivals_check = []
-    for ap in applied_prearrivals:
-        session_prearrivals_check.append(functions.validate_check(ap))
+    logger.info("Additional information check: %s", addl["result"])
 
-    if len(session_question_check) == 0:
-        out_json["Call-taker used guidecards to provide prearrival instructions?"]["result"] = "N/A"
-    elif relaxation(session_question_check,int(0.0 * (len(applied_questions)))):
-        out_json["Call-taker used guidecards to provide prearrival instructions?"]["result"] = "YES"
-        out_json["Call-taker used guidecards to provide prearrival instructions?"]["explanation"] += "Applied instructions are necessarily given."
+    threshold = int(0.0 * len(applied_prearrivals))
+    if len(session_prearrivals_check) == 0:
+        prea["result"] = "N/A"
+    elif relaxation(session_prearrivals_check, threshold):
+        prea["result"] = "YES"
+        prea["explanation"] += "Applied instructions are necessarily given."
 
-    elif False in session_question_check:
-        false_index = session_question_check.index(False)
-        out_json["Call-taker used guidecards to provide prearrival instructions?"]["result"] = "NO"
-        out_json["Call-taker used guidecards to provide prearrival instructions?"]["explanation"] += f"Applied instructions are not necessarily given, e.g., {applied_prearrivals[false_index]}."
+    elif False in session_prearrivals_check:
+        false_index = session_prearrivals_check.index(False)
+        prea["result"] = "NO"
+        prea["explanation"] += f"Applied instructions are not necessarily given, e.g., {applied_prearrivals[false_index]}."
 
-    logger.info("Prearrival instructions check: %s",
-                out_json["Call-taker used guidecards to provide prearrival instructions?"]["result"])
-
-    with open("out.json", "w") as jfile:
-        json.dump(out_json, jfile, indent=4)
+    logger.info("Prearrival instructions check: %s", prea["result"])
 
     return out_json
 
 
-current_dir = os.path.dirname(__file__)
-
-
-def debrief(functions: FunctionAgents, conversation: str, task_json: Dict[str, Any]) -> Dict[str, Any]:
+def debrief(functions: "FunctionAgents", conversation: str, task_json: Dict[str, Any]) -> Dict[str, Any]:
     """Optimized debrief function with parallel processing.
     
     Args:
@@ -453,61 +551,52 @@ def debrief(functions: FunctionAgents, conversation: str, task_json: Dict[str, A
             "explanation": result['explanations']
         }
 
-    def validate_general_check(check):
-        logger.debug(f"Validating general check: {check}")
-        return check, functions.validate_general_check(check)
-
     def validate_flags():
         logger.debug("Validating flags...")
         return functions.validate_context()
 
-    def process_guidecard_checks(conditions, questions, prearrivals):
+    def process_guidecard_checks(executor, conditions, questions, prearrivals):
         logger.debug("Processing guidecard checks...")
-        condition_return = functions.validate_precondition(conditions)
-        applied_conditions = condition_return['result']
-        explanation = condition_return['explanations']
-        out_json["Call-taker used guidecards to obtain additional information?"]["explanation"] = explanation
-        out_json["Call-taker used guidecards to provide prearrival instructions?"]["explanation"] = explanation
+        precond = functions.validate_precondition(conditions)
+        applied_conditions = frozenset(precond['result'])
+        for key in _PRECOND_EXPL_KEYS:
+            out_json[key]["explanation"] = precond['explanations']
 
         applied_questions = get_satisfied_values(applied_conditions, questions)
         applied_prearrivals = get_satisfied_values(applied_conditions, prearrivals)
 
-        with ThreadPoolExecutor() as executor:
-            question_futures = {
-                executor.submit(functions.validate_check, question): question for question in applied_questions
-            }
-            prearrival_futures = {
-                executor.submit(functions.validate_check, prearrival): prearrival for prearrival in applied_prearrivals
-            }
-
-            session_question_check = []
-            session_prearrivals_check = []
-
-            for future in as_completed(question_futures):
-                question = question_futures[future]
-                try:
-                    result = future.result()['result']
-                    session_question_check.append(result)
-                    if result:
-                        out_json["applied_questions"].append(question)
-                    else:
-                        out_json["not_applied_questions"].append(question)
-                except Exception as e:
-                    logger.error(f"Error validating question {question}: {e}")
-                    session_question_check.append(False)
-
-            for future in as_completed(prearrival_futures):
-                prearrival = prearrival_futures[future]
-                try:
-                    result = future.result()['result']
-                    session_prearrivals_check.append(result)
-                    if result:
-                        out_json["applied_prearrivals"].append(prearrival)
-                    else:
-                        out_json["not_applied_prearrivals"].append(prearrival)
-                except Exception as e:
-                    logger.error(f"Error validating prearrival {prearrival}: {e}")
-                    session_prearrivals_check.append(False)
+        # Items shared by questions and prearrivals are only checked once,
+        # in calls that run concurrently
+        unique_items = list(dict.fromkeys(applied_questions + applied_prearrivals))
+        check_futures = _submit_checks(executor, functions, unique_items)
+
+        # Failed calls count as not applied and are reported together
+        check_results, errors = {}, []
+        for future in as_completed(check_futures):
+            items = check_futures[future]
+            try:
+                results = [r['result'] for r in future.result()]
+            except Exception as e:
+                errors.extend((item, e) for item in items)
+                results = [False] * len(items)
+            check_results.update(zip(items, results))
+        if errors:
+            logger.error("Failed to validate %d guidecard checks: %s", len(errors), errors[:3])
+
+        session_question_check = [check_results[question] for question in applied_questions]
+        session_prearrivals_check = [check_results[prearrival] for prearrival in applied_prearrivals]
+
+        for question, result in zip(applied_questions, session_question_check):
+            if result:
+                out_json["applied_questions"].append(question)
+            else:
+                out_json["not_applied_questions"].append(question)
+
+        for prearrival, result in zip(applied_prearrivals, session_prearrivals_check):
+            if result:
+                out_json["applied_prearrivals"].append(prearrival)
+            else:
+                out_json["not_applied_prearrivals"].append(prearrival)
 
         return session_question_check, session_prearrivals_check
 
@@ -520,7 +609,7 @@ def debrief(functions: FunctionAgents, conversation: str, task_json: Dict[str, A
         "Call-taker obtained scene safety / suspect information?"
     ]
 
-    with ThreadPoolExecutor() as executor:
+    with ThreadPoolExecutor(max_workers=_MAX_WORKERS) as executor:
         logger.debug("Starting parallel tasks...")
 
         # Start address, phone, name validations in parallel
@@ -529,7 +618,7 @@ def debrief(functions: FunctionAgents, conversation: str, task_json: Dict[str, A
         name_future = executor.submit(validate_name)
 
         # Start general checks validation in parallel
-        general_checks_futures = {executor.submit(validate_general_check, check): check for check in general_checks}
+        general_checks_futures = _submit_checks(executor, functions, general_checks, general=True)
 
         # Validate flags first (dependency for instructions)
         logger.debug("Waiting for flags validation...")
@@ -543,15 +632,12 @@ def debrief(functions: FunctionAgents, conversation: str, task_json: Dict[str, A
 
         # Read guidecard files after flags are checked
         incident_type = task_json["incident_spec"]["incident_type"]
-        with open(os.path.join(current_dir, "guidecards", incident_type, "conditions.json"), "r") as file:
-            conditions = json.load(file)
-        with open(os.path.join(current_dir, "guidecards", incident_type, "questions.json"), "r") as file:
-            questions = json.load(file)
-        with open(os.path.join(current_dir, "guidecards", incident_type, "instructions.json"), "r") as file:
-            prearrivals = json.load(file)
+        conditions_path, questions, prearrivals = _guidecard(incident_type)
+        conditions = _load_json(conditions_path)
+        # Questions and prearrivals are passed by path so their indexed form is reused
 
         # Process guidecard-related checks
-        session_question_check, session_prearrivals_check = process_guidecard_checks(conditions, questions, prearrivals)
+        session_question_check, session_prearrivals_check = process_guidecard_checks(executor, conditions, questions, prearrivals)
 
         # Collect results for address, phone, name
         logger.debug("Waiting for address, phone, and name validations...")
@@ -563,8 +649,8 @@ def debrief(functions: FunctionAgents, conversation: str, task_json: Dict[str, A
         # Process general checks
         logger.debug("Processing general checks...")
         for future in as_completed(general_checks_futures):
-            check, result = future.result()
-            out_json[check] = result
+            for check, result in zip(general_checks_futures[future], future.result()):
+                out_json[check] = result
 
     logger.info("Debrief function completed successfully.")
     return out_json
@@ -609,13 +695,20 @@ Examples:
         action='store_true',
         help='Only validate configuration without running debrief'
     )
+    parser.add_argument(
+        '--batch-checks',
+        action='store_true',
+        help='Send several checks per assistant call (the check and general assistants must support it)'
+    )
     
     args = parser.parse_args()
     
+    functions = None
     try:
-        # Initialize function agents
+        # Initialize function agents; imported here so --help stays fast
+        from functions import FunctionAgents
         logger.info("Initializing FunctionAgents...")
-        functions = FunctionAgents()
+        functions = FunctionAgents(batch_checks=args.batch_checks)
         
         # Validate configuration
         if args.validate_only:
@@ -651,26 +744,19 @@ Examples:
         
         # Load input data
         logger.info(f"Loading conversation from: {conversation_path}")
-        with open(conversation_path, 'r') as f:
-            conversation = f.read()
+        conversation = conversation_path.read_text(encoding='utf-8')
         
         logger.info(f"Loading task configuration from: {task_path}")
-        with open(task_path, 'r') as f:
-            task_json = json.load(f)
+        task_json = _loads(task_path.read_bytes())
         
         # Validate task JSON structure
-        required_fields = ['incident_spec']
-        incident_fields = ['incident_type']
-        
-        for field in required_fields:
-            if field not in task_json:
-                logger.error(f"Missing required field in task JSON: {field}")
-                return 1
-        
-        for field in incident_fields:
-            if field not in task_json['incident_spec']:
-                logger.error(f"Missing required field in incident_spec: {field}")
-                return 1
+        missing = [field for field in _REQUIRED if field not in task_json]
+        if 'incident_spec' in task_json:
+            missing += [f"incident_spec.{field}" for field in _INCIDENT_REQUIRED
+                        if field not in task_json['incident_spec']]
+        if missing:
+            logger.error(f"Missing required field(s) in task JSON: {', '.join(missing)}")
+            return 1
         
         # Run debrief
         logger.info("Starting debrief process...")
@@ -679,8 +765,8 @@ Examples:
         # Save output
         output_path = Path(args.output)
         logger.info(f"Saving results to: {output_path}")
-        with open(output_path, 'w') as f:
-            json.dump(result, f, indent=4)
+        with open(output_path, 'wb') as f:
+            f.write(_dumps(result))
         
         logger.info("Debrief completed successfully!")
         return 0
@@ -688,6 +774,9 @@ Examples:
     except Exception as e:
         logger.error(f"Error during execution: {e}", exc_info=True)
         return 1
+    finally:
+        if functions is not None:
+            functions.close()
 
 
 if __name__ == "__main__":